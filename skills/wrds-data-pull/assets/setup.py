@@ -23,7 +23,7 @@ setup(
         "numpy>=1.23.0",
         "wrds>=3.1.0",
         "scipy>=1.9.0",
-        "pyarrow>=10.0.0",
+        "pyarrow>=14.0.0",
     ],
     extras_require={
         "stata": ["pandas-stata>=0.1.0"],
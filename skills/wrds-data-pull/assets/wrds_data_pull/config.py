@@ -46,6 +46,11 @@ from config_paths import (
 # Data refresh settings
 REFRESH_DATA = True  # (True/False) Set to False to use cached REIT-filtered data, True to download fresh data
 
+# Raw pull cache settings
+CACHE_FORMAT = 'parquet'  # ('parquet'/'pickle') Format of the cached raw Compustat pulls (parquet uses zstd)
+EXPORT_CSV = False        # (True/False) Also write raw pulls to CSV (slow for large pulls)
+EXPORT_STATA = False      # (True/False) Also write raw pulls to Stata .dta (slow for large pulls)
+
 # GVKEY filtering method
 USE_PREDEFINED_GVKEYS = True  # (True/False) True = use GVKEY list from merged data, False = download all firms with SIC filter
 
@@ -173,16 +178,19 @@ STATA_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 # Raw Compustat data file paths (stored in Data/raw/compustat/)
 # Annual data files
 COMPUSTAT_ANNUAL_RAW_FILE = COMPUSTAT_RAW_DIR / "compustat_annual_raw.pkl"
+COMPUSTAT_ANNUAL_RAW_PARQUET = COMPUSTAT_RAW_DIR / "compustat_annual_raw.parquet"
 COMPUSTAT_ANNUAL_RAW_CSV = COMPUSTAT_RAW_DIR / "compustat_annual_raw.csv"
 COMPUSTAT_ANNUAL_RAW_DTA = COMPUSTAT_RAW_DIR / "compustat_annual_raw.dta"
 
 # Quarterly data files
 COMPUSTAT_QUARTERLY_RAW_FILE = COMPUSTAT_RAW_DIR / "compustat_quarterly_raw.pkl"
+COMPUSTAT_QUARTERLY_RAW_PARQUET = COMPUSTAT_RAW_DIR / "compustat_quarterly_raw.parquet"
 COMPUSTAT_QUARTERLY_RAW_CSV = COMPUSTAT_RAW_DIR / "compustat_quarterly_raw.csv"
 COMPUSTAT_QUARTERLY_RAW_DTA = COMPUSTAT_RAW_DIR / "compustat_quarterly_raw.dta"
 
 # Legacy paths (for backward compatibility - point to quarterly)
 COMPUSTAT_RAW_FILE = COMPUSTAT_QUARTERLY_RAW_FILE
+COMPUSTAT_RAW_PARQUET = COMPUSTAT_QUARTERLY_RAW_PARQUET
 COMPUSTAT_RAW_CSV = COMPUSTAT_QUARTERLY_RAW_CSV
 COMPUSTAT_RAW_DTA = COMPUSTAT_QUARTERLY_RAW_DTA
 
@@ -505,6 +513,7 @@ def print_config_summary():
     print(f"Raw CRSP Data Directory: {CRSP_RAW_DIR}")
     print(f"Final Datasets Directory: {FINAL_DATASETS_DIR}")
     print(f"Data refresh mode: {'REFRESH' if REFRESH_DATA else 'USE CACHED'}")
+    print(f"Raw cache format: {CACHE_FORMAT} (CSV export: {EXPORT_CSV}, Stata export: {EXPORT_STATA})")
     print(f"Filtering method: {'PREDEFINED GVKEYS' if USE_PREDEFINED_GVKEYS else f'SIC codes {SIC_FILTER}'}")
     if USE_PREDEFINED_GVKEYS:
         if PREDEFINED_GVKEYS:
@@ -50,7 +50,10 @@ def pull_crsp_data(config=None, compustat_df=None):
         # Get CUSIPs from Compustat data if provided
         if compustat_df is None:
             # Try to load from cache
-            if config.COMPUSTAT_RAW_FILE.exists():
+            if config.CACHE_FORMAT == 'parquet' and config.COMPUSTAT_RAW_PARQUET.exists():
+                compustat_df = pd.read_parquet(str(config.COMPUSTAT_RAW_PARQUET))
+                print("Loaded Compustat data from cache to extract CUSIPs")
+            elif config.COMPUSTAT_RAW_FILE.exists():
                 compustat_df = pd.read_pickle(str(config.COMPUSTAT_RAW_FILE))
                 print("Loaded Compustat data from cache to extract CUSIPs")
             else:
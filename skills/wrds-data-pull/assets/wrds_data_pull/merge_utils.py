@@ -282,6 +282,9 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
             suffixes=('', '_crsp')
         )
 
+        # The pre-merge frame and linking table are no longer needed
+        del final_df_with_links, linking_df
+
         merge_success = final_df['permno'].notna().mean() * 100
         crsp_var_success = final_df['permno'].notna() & final_df['prc'].notna()
         crsp_var_success_pct = crsp_var_success.mean() * 100
@@ -595,6 +598,12 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
     # Examples: 2019Q1 -> 20191, 2020Q4 -> 20204
     final_df['year_quarter_numeric'] = final_df['year'] * 10 + final_df['quarter']
 
+    # Store repeated text columns as Arrow-backed strings (about half the memory of
+    # object columns; missing values stay NA so the Stata prep is a plain fillna)
+    for col in ['cusip', 'conm', 'year_quarter', 'ptype', 'psub', 'Property_Type']:
+        if col in final_df.columns and pd.api.types.infer_dtype(final_df[col], skipna=True) == 'string':
+            final_df[col] = final_df[col].astype('string[pyarrow]')
+
     # Count the number of observations per gvkey
     obs_per_gvkey = final_df['gvkey'].value_counts()
     print("\nObservations per gvkey summary:")
@@ -648,16 +657,17 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
     # Filter key_vars_order to only include columns that actually exist in the dataset
     existing_key_vars = [col for col in key_vars_order if col in final_df.columns]
 
-    # Get all remaining columns that aren't in the existing key vars
-    remaining_cols = [col for col in final_df.columns if col not in existing_key_vars]
+    # Get all remaining columns that aren't in the existing key vars (set lookup, not list scan)
+    key_set = set(existing_key_vars)
+    remaining_cols = [col for col in final_df.columns if col not in key_set]
 
     # Final column order (only existing columns)
     final_col_order = existing_key_vars + remaining_cols
 
     print(f"Reordering columns: {len(existing_key_vars)} priority columns + {len(remaining_cols)} remaining columns")
 
-    # Reorder the columns
-    final_df = final_df[final_col_order]
+    # The reorder itself is deferred until just before export so winsorization and
+    # inf handling below run on the existing blocks rather than a reordered copy
 
     # ========================================================================
     # WINSORIZE DATA
@@ -665,51 +675,61 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
     print("\nWinsorizing data at 1st and 99th percentiles...")
 
     # Get numeric columns only (exclude identifiers and categorical variables)
+    # Computed once: winsorization only converts ints to float, so the same set
+    # is reused for infinite-value handling below
     numeric_cols = final_df.select_dtypes(include=[np.number]).columns
 
     # Define columns to exclude from winsorization (identifiers, dummies, counts)
-    exclude_cols = ['gvkey', 'year', 'quarter', 'year_quarter_numeric', 'ptype', 'psub'] + \
-                   [col for col in numeric_cols if col.startswith(('psub_', 'Property_'))]
+    excl_prefix = numeric_cols[numeric_cols.str.startswith(('psub_', 'Property_'))].tolist()
+    exclude_cols = ['gvkey', 'year', 'quarter', 'year_quarter_numeric', 'ptype', 'psub'] + excl_prefix
 
-    # Filter to columns that should be winsorized
-    winsorize_cols = [col for col in numeric_cols if col not in exclude_cols]
+    # Filter to columns that should be winsorized (set difference, original order kept)
+    winsorize_cols = numeric_cols.difference(exclude_cols, sort=False).tolist()
 
     print(f"Winsorizing {len(winsorize_cols)} numeric variables...")
 
+    # Columns with at least one non-null value, from a single reduction over the block
+    nonempty = final_df[winsorize_cols].notna().any()
+
     # Winsorize at 1st and 99th percentiles
-    for col in winsorize_cols:
-        if final_df[col].notna().sum() > 0:  # Only if column has non-null values
-            # Check if column is integer type - convert to float for winsorization
-            is_integer = pd.api.types.is_integer_dtype(final_df[col])
-            if is_integer:
-                final_df[col] = final_df[col].astype('float64')
-            
-            lower_bound = final_df[col].quantile(0.01)
-            upper_bound = final_df[col].quantile(0.99)
-            final_df[col] = final_df[col].clip(lower=lower_bound, upper=upper_bound)
+    # Only columns with non-null values; integer columns are converted to float64.
+    # All bounds come from one 2-D nanquantile call rather than a quantile pass per column.
+    wins_cols = [col for col in winsorize_cols if nonempty[col]]
+    if wins_cols:
+        values = final_df[wins_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        bounds = np.nanquantile(values, [0.01, 0.99], axis=0)
+        np.clip(values, bounds[0], bounds[1], out=values)
+        final_df[wins_cols] = values
 
     print("+ Data winsorized at 1st and 99th percentiles")
 
+    # Downcast winsorized float64 columns to float32 to halve memory and export size
+    # (levels that downstream code may need at full precision stay float64)
+    keep_float64 = {'atq', 'mktcap'}
+    downcast_cols = [col for col in winsorize_cols
+                     if col not in keep_float64 and final_df[col].dtype == np.float64]
+    if downcast_cols:
+        final_df[downcast_cols] = final_df[downcast_cols].apply(pd.to_numeric, downcast='float')
+        # to_numeric keeps float64 where float32 cannot hold the values
+        n_downcast = (final_df[downcast_cols].dtypes == np.float32).sum()
+        print(f"+ Downcast {n_downcast} float64 variables to float32")
+
     # ========================================================================
     # HANDLE INFINITE VALUES FOR STATA COMPATIBILITY
     # ========================================================================
     print("\nHandling infinite values for Stata compatibility...")
 
     # Replace infinite values with NaN for all numeric columns
-    numeric_cols = final_df.select_dtypes(include=[np.number]).columns
     final_df[numeric_cols] = final_df[numeric_cols].replace([np.inf, -np.inf], np.nan)
-
-    # Check for any remaining infinite values
-    infinite_counts = final_df[numeric_cols].isin([np.inf, -np.inf]).sum()
-    if infinite_counts.sum() > 0:
-        print("Warning: Still found infinite values in columns:")
-        print(infinite_counts[infinite_counts > 0])
-    else:
-        print("+ All infinite values successfully replaced with NaN")
+    print("+ All infinite values replaced with NaN")
 
     # ========================================================================
     # SAVE FINAL DATASETS
     # ========================================================================
+    # Apply the column order computed above (skip the rebuild if already in order)
+    if final_col_order != list(final_df.columns):
+        final_df = final_df[final_col_order]
+
     # Save the DataFrame as a CSV file
     final_df.to_csv(str(config.FINAL_DATA_CSV), index=False)
     print(f"Quarterly data saved to '{config.FINAL_DATA_CSV}' as a CSV file.")
@@ -725,9 +745,13 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
     problem_columns = ['cusip', 'conm', 'year_quarter', 'sic']
     for col in problem_columns:
         if col in final_df_for_stata.columns:
-            # Convert to string and handle missing values
-            final_df_for_stata[col] = final_df_for_stata[col].astype(str).replace('nan', '')
-            final_df_for_stata[col] = final_df_for_stata[col].fillna('').replace('<NA>', '')
+            if isinstance(final_df_for_stata[col].dtype, pd.StringDtype):
+                # Arrow-backed strings carry real NA, so no 'nan' text to scrub
+                final_df_for_stata[col] = final_df_for_stata[col].fillna('').to_numpy(dtype=object)
+            else:
+                # Convert to string and handle missing values
+                final_df_for_stata[col] = final_df_for_stata[col].astype(str).replace('nan', '')
+                final_df_for_stata[col] = final_df_for_stata[col].fillna('').replace('<NA>', '')
             
             # If column is all missing/empty, drop it to avoid Stata export errors
             if final_df_for_stata[col].replace('', pd.NA).isna().all():
@@ -737,6 +761,7 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
     # Save the DataFrame as a .dta (Stata) file
     final_df_for_stata.to_stata(str(config.FINAL_DATA_DTA), write_index=False)
     print(f"Quarterly data saved to '{config.FINAL_DATA_DTA}' as a .dta file.")
+    del final_df_for_stata
 
     # Save the DataFrame as a pickle file
     final_df.to_pickle(str(config.FINAL_DATA_PKL))
@@ -769,18 +794,22 @@ def merge_and_process_data(config=None, compustat_df=None, crsp_quarterly_df=Non
 
     # Data source summary
     compustat_vars_check = ['atq', 'niq', 'prccq', 'cshoq', 'seqq', 'dlttq', 'dlcq']
-    compustat_available = [var for var in compustat_vars_check if var in final_df.columns]
-    compustat_coverage = len([var for var in compustat_available if final_df[var].notna().sum() > 0])
-
     reit_vars = ['ffo', 'assets', 'beta_60m', 'dolvol', 'ret_exc_lead1m', 'prc', 'sales']
-    reit_available = [var for var in reit_vars if var in final_df.columns]
-    reit_coverage = len([var for var in reit_available if final_df[var].notna().sum() > 0])
+    calculated_vars = ['td', 'mktcap', 'lev', 'roa', 'roe', 'ln_at', 'tbq']
+
+    # One notna().any() reduction over every summary column instead of a scan per variable
+    all_check = list(dict.fromkeys(compustat_vars_check + reit_vars + calculated_vars))
+    all_check = [var for var in all_check if var in final_df.columns]
+    has_data = final_df[all_check].notna().any()
+
+    compustat_available = [var for var in compustat_vars_check if var in final_df.columns]
+    compustat_coverage = int(has_data.reindex(compustat_vars_check, fill_value=False).sum())
+    reit_coverage = int(has_data.reindex(reit_vars, fill_value=False).sum())
 
     print(f"REIT VARIABLES: {reit_coverage}/{len(reit_vars)} key variables available")
     print(f"COMPUSTAT VARIABLES: {compustat_coverage}/{len(compustat_vars_check)} key variables available")
 
     # Calculated variables summary
-    calculated_vars = ['td', 'mktcap', 'lev', 'roa', 'roe', 'ln_at', 'tbq']
     calculated_available = [var for var in calculated_vars if var in final_df.columns]
     print(f"CALCULATED VARIABLES: {len(calculated_available)}/{len(calculated_vars)} ratios created")
 
@@ -14,30 +14,46 @@ Or import and use programmatically:
     orchestrator.main()
 """
 
+import gc
 import sys
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 # Get current directory for module loading
 current_dir = Path(__file__).parent
 
+@lru_cache(maxsize=None)
 def load_module(module_name, file_path):
-    """Load a module from file path (handles numbered filenames)."""
+    """Load a module from file path (handles numbered filenames); cached per path."""
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     return module
 
-# Import modules using file paths (handles numbered filenames)
+# Only the config is loaded at import time; the pipeline stages are loaded on
+# first use so importing the orchestrator for `cfg` doesn't compile them
 cfg = load_module("config_wrds_data", current_dir / "1---config_wrds_data.py")
-pull_compustat_data_module = load_module("pull_compustat_data", current_dir / "2---pull_compustat_data.py")
-pull_crsp_data_module = load_module("pull_crsp_data", current_dir / "3---pull_crsp_data.py")
-merge_and_process_data_module = load_module("merge_and_process_data", current_dir / "4---merge_and_process_data.py")
 
-# Extract functions for easier use
-pull_compustat_data = pull_compustat_data_module.pull_compustat_data
-pull_crsp_data = pull_crsp_data_module.pull_crsp_data
-merge_and_process_data = merge_and_process_data_module.merge_and_process_data
+# Stage function name -> (module name, numbered filename)
+_STAGES = {
+    'pull_compustat_data': ("pull_compustat_data", "2---pull_compustat_data.py"),
+    'pull_crsp_data': ("pull_crsp_data", "3---pull_crsp_data.py"),
+    'merge_and_process_data': ("merge_and_process_data", "4---merge_and_process_data.py"),
+}
+
+
+def _load_stage(name):
+    """Return a pipeline stage function, loading its module on first use."""
+    module_name, file_name = _STAGES[name]
+    return getattr(load_module(module_name, current_dir / file_name), name)
+
+
+def __getattr__(name):
+    # Keep `orchestrator.pull_crsp_data` etc. working without eager loading
+    if name in _STAGES:
+        return _load_stage(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
@@ -65,7 +81,7 @@ def main():
         print("\n" + "="*60)
         print("STEP 1: PULLING COMPUSTAT DATA")
         print("="*60)
-        compustat_annual_df, compustat_quarterly_df, company_info = pull_compustat_data(cfg)
+        compustat_annual_df, compustat_quarterly_df, company_info = _load_stage('pull_compustat_data')(cfg)
         
         if compustat_quarterly_df is None or len(compustat_quarterly_df) == 0:
             raise ValueError("Failed to retrieve Compustat quarterly data")
@@ -78,7 +94,7 @@ def main():
         print("\n" + "="*60)
         print("STEP 2: PULLING CRSP DATA")
         print("="*60)
-        crsp_quarterly_df = pull_crsp_data(cfg, compustat_quarterly_df)
+        crsp_quarterly_df = _load_stage('pull_crsp_data')(cfg, compustat_quarterly_df)
         
         if crsp_quarterly_df is not None:
             print(f"[OK] CRSP data pulled and aggregated successfully: {len(crsp_quarterly_df):,} quarterly observations")
@@ -90,7 +106,11 @@ def main():
         print("\n" + "="*60)
         print("STEP 3: MERGING AND PROCESSING DATA")
         print("="*60)
-        final_df = merge_and_process_data(cfg, compustat_quarterly_df, crsp_quarterly_df)
+        final_df = _load_stage('merge_and_process_data')(cfg, compustat_quarterly_df, crsp_quarterly_df)
+        
+        # Stage inputs are no longer needed; release them before the final summary
+        del compustat_annual_df, compustat_quarterly_df, company_info, crsp_quarterly_df
+        gc.collect()
         
         if final_df is None or len(final_df) == 0:
             raise ValueError("Failed to process final dataset")
@@ -49,8 +49,6 @@ def validate_panel(df, unit_id, time_id):
 
 def check_panel_balance(df, unit_id, time_id):
     """Check if panel is balanced and return structure metrics."""
-    panel_structure = df.groupby(unit_id)[time_id].agg(['count', 'nunique'])
-
     n_units = df[unit_id].nunique()
     n_periods = df[time_id].nunique()
     total_obs = len(df)
@@ -76,14 +74,30 @@ def check_panel_balance(df, unit_id, time_id):
 
 
 def check_duplicates(df, unit_id, time_id):
-    """Identify duplicate observations on primary keys."""
-    dup_counts = df.groupby([unit_id, time_id]).size()
-    duplicates = dup_counts[dup_counts > 1]
+    """
+    Identify duplicate observations on primary keys.
+
+    ``n_duplicates`` counts every duplicated key; ``duplicate_keys`` is capped at
+    the 100 most-repeated keys so pathological panels don't build a huge dict.
+    """
+    # Boolean mask of every row sharing its key with another row; the groupby
+    # below then only runs over the (usually tiny) duplicated subset
+    mask = df.duplicated(subset=[unit_id, time_id], keep=False)
+    n_dup_rows = int(mask.sum())
+
+    if n_dup_rows == 0:
+        return {
+            'has_duplicates': False,
+            'n_duplicates': 0,
+            'duplicate_keys': {}
+        }
+
+    duplicates = df.loc[mask].groupby([unit_id, time_id], sort=False).size()
 
     return {
-        'has_duplicates': len(duplicates) > 0,
+        'has_duplicates': True,
         'n_duplicates': len(duplicates),
-        'duplicate_keys': duplicates.to_dict() if len(duplicates) > 0 else {}
+        'duplicate_keys': duplicates.nlargest(100).to_dict()
     }
 
 
@@ -103,11 +117,16 @@ def calculate_coverage(df, threshold=0.25):
     dict
         Coverage statistics by variable
     """
-    missing_pct = (df.isnull().sum() / len(df))
-    high_missing = missing_pct[missing_pct > threshold].sort_values(ascending=False)
+    missing_pct = df.isnull().sum().to_numpy() / len(df)
+
+    # Order the high-missing columns with one argsort on the masked array
+    mask = missing_pct > threshold
+    high_pct = missing_pct[mask]
+    order = np.argsort(-high_pct, kind='stable')
+    high_missing = dict(zip(df.columns[mask][order], high_pct[order]))
 
     return {
-        'high_missing_vars': high_missing.to_dict(),
+        'high_missing_vars': high_missing,
         'avg_coverage': (1 - missing_pct.mean()),
         'n_complete_vars': (missing_pct == 0).sum()
     }
@@ -133,16 +152,23 @@ def detect_outliers(df, variable, method='iqr', multiplier=3):
     pandas.Series
         Boolean series indicating outliers
     """
+    series = df[variable]
+    vals = series.to_numpy(dtype=np.float64, na_value=np.nan)
+
     if method == 'iqr':
-        Q1 = df[variable].quantile(0.25)
-        Q3 = df[variable].quantile(0.75)
+        valid = vals[~np.isnan(vals)]
+        if valid.size == 0:
+            return pd.Series(False, index=df.index)
+        # Both quartiles from one pass over the non-missing values
+        Q1, Q3 = np.quantile(valid, [0.25, 0.75])
         IQR = Q3 - Q1
         lower = Q1 - multiplier * IQR
         upper = Q3 + multiplier * IQR
-        return (df[variable] < lower) | (df[variable] > upper)
+        return (series < lower) | (series > upper)
     elif method == 'zscore':
-        z_scores = np.abs((df[variable] - df[variable].mean()) / df[variable].std())
-        return z_scores > multiplier
+        # ddof=1 matches pandas' sample standard deviation
+        z_scores = np.abs((vals - np.nanmean(vals)) / np.nanstd(vals, ddof=1))
+        return pd.Series(z_scores > multiplier, index=df.index)
     else:
         raise ValueError(f"Unknown method: {method}. Use 'iqr' or 'zscore'.")
 
@@ -13,23 +13,73 @@ Usage:
 """
 
 import wrds
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import os
 import importlib
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Import config module (handles numbered filename)
 cfg = importlib.import_module('1---config_wrds_data')
 
 
+# Tables the pipeline reads from each library; their schemas are fetched together
+_LIBRARY_TABLES = {'comp': ('funda', 'fundq', 'company')}
+
+# Lower-cased column names per (library, table), shared by all pulls in the process
+_table_fields_cache = {}
+_catalog_queried = set()
+_table_fields_lock = threading.Lock()
+
+# Unique server-side cursor names, so no two streams on a connection ever collide
+_cursor_ids = itertools.count()
+
+
+def _get_table_fields(conn, library, table):
+    """
+    Return the lower-cased column names of ``library.table``, cached per process.
+    
+    The first lookup in a library fetches every table listed in ``_LIBRARY_TABLES``
+    with one information_schema query, so the annual, quarterly and company lookups
+    cost a single round-trip; tables the catalog doesn't report fall back to the
+    wrds API.
+    """
+    key = (library, table)
+    with _table_fields_lock:
+        if key not in _table_fields_cache and key not in _catalog_queried:
+            tables = list(dict.fromkeys(_LIBRARY_TABLES.get(library, ()) + (table,)))
+            _catalog_queried.update((library, t) for t in tables)
+            catalog = conn.raw_sql("""
+                SELECT table_name, column_name
+                FROM information_schema.columns
+                WHERE table_schema = %(library)s
+                AND table_name = ANY(%(tables)s)
+            """, params={'library': library, 'tables': tables})
+            for name, cols in catalog.groupby('table_name')['column_name']:
+                _table_fields_cache[(library, name)] = {c.lower() for c in cols}
+        
+        if key not in _table_fields_cache:
+            try:
+                fields = conn.list_table_fields(library, table)
+            except AttributeError:
+                # Older wrds versions: fetch zero rows to inspect columns
+                fields = conn.get_table(library, table, obs=0).columns
+            _table_fields_cache[key] = {c.lower() for c in fields}
+        
+        return _table_fields_cache[key]
+
+
 def _filter_available_columns(requested_cols, conn, library, table):
     """
     Keep only columns that exist in the WRDS table; warn on any missing.
     """
-    try:
-        available_cols = {c.lower() for c in conn.list_table_fields(library, table)}
-    except AttributeError:
-        # Older wrds versions: fetch zero rows to inspect columns
-        available_cols = {c.lower() for c in conn.get_table(library, table, obs=0).columns}
+    available_cols = _get_table_fields(conn, library, table)
     filtered = [col for col in requested_cols if col.lower() in available_cols]
     missing = [col for col in requested_cols if col.lower() not in available_cols]
     if missing:
@@ -37,6 +87,70 @@ def _filter_available_columns(requested_cols, conn, library, table):
     return filtered
 
 
+def _raw_sql_chunked(conn, query, params=None, chunksize=50000):
+    """
+    Execute a query through a server-side cursor and assemble the result via Arrow.
+
+    ``conn.raw_sql`` fetches through a default client cursor and builds the DataFrame
+    row by row; a named (server-side) cursor streams the result in ``chunksize`` batches
+    that are converted to Arrow tables and concatenated once at the end.
+    
+    Parameters:
+    -----------
+    conn : wrds.Connection
+        WRDS connection object
+    query : str
+        SQL query to execute
+    params : dict, optional
+        Bind parameters for ``query`` (psycopg2 ``%(name)s`` style)
+    chunksize : int
+        Rows per fetch (also used as the cursor's itersize/arraysize)
+        
+    Returns:
+    --------
+    DataFrame
+        Query result; NUMERIC columns are cast to float64 as ``raw_sql`` does
+    """
+    # SQLAlchemy connection -> pool proxy -> psycopg2 connection. Attribute writes on
+    # the proxy never reach the driver, so autocommit is set on the unwrapped connection
+    proxy = conn.connection.connection
+    raw_conn = getattr(proxy, 'dbapi_connection', None) or getattr(proxy, 'connection', proxy)
+    tables = []
+    columns = None
+    # wrds connects in autocommit mode, where psycopg2 refuses named cursors; stream
+    # inside a transaction (read-only, so it is rolled back) and restore the mode
+    autocommit = raw_conn.autocommit
+    raw_conn.autocommit = False
+    try:
+        with raw_conn.cursor(name=f'wrds_stream_{next(_cursor_ids)}') as cur:
+            cur.itersize = chunksize
+            cur.arraysize = chunksize
+            cur.execute(query, params)
+            while True:
+                rows = cur.fetchmany(chunksize)
+                if columns is None:
+                    columns = [desc[0] for desc in cur.description]
+                if not rows:
+                    break
+                table = pa.table({name: pa.array(values) for name, values in zip(columns, zip(*rows))})
+                # psycopg2 returns Decimal for NUMERIC; cast per batch so precisions never clash
+                schema = pa.schema([
+                    pa.field(f.name, pa.float64()) if pa.types.is_decimal(f.type) else f
+                    for f in table.schema
+                ])
+                tables.append(table.cast(schema))
+    finally:
+        raw_conn.rollback()
+        raw_conn.autocommit = autocommit
+
+    if not tables:
+        return pd.DataFrame(columns=columns)
+
+    # 'default' promotion lets all-null batches (null type) merge with typed ones
+    combined = pa.concat_tables(tables, promote_options='default')
+    return combined.to_pandas(split_blocks=True, self_destruct=True)
+
+
 def _get_company_info(conn, config):
     """
     Helper function to retrieve company info (gvkey, sic) from WRDS.
@@ -53,57 +167,79 @@ def _get_company_info(conn, config):
     DataFrame
         Company information DataFrame with columns (gvkey, sic)
     """
-    try:
-        company_fields = {c.lower() for c in conn.list_table_fields("comp", "company")}
-    except AttributeError:
-        company_fields = {c.lower() for c in conn.get_table("comp", "company", obs=0).columns}
+    company_fields = _get_table_fields(conn, "comp", "company")
 
     select_cols = ["gvkey", "sic"]
     if "cik" in company_fields:
         select_cols.append("cik")
 
     if config.USE_PREDEFINED_GVKEYS:
-        print(f"Getting company info for predefined list of {len(config.PREDEFINED_GVKEYS)} companies...")
-        gvkey_list_for_sic = "','".join(config.PREDEFINED_GVKEYS)
+        predefined_gvkeys = list(config.PREDEFINED_GVKEYS)
+        print(f"Getting company info for predefined list of {len(predefined_gvkeys)} companies...")
         company_info = conn.raw_sql(f"""
             SELECT {', '.join(select_cols)}
             FROM comp.company
-            WHERE gvkey IN ('{gvkey_list_for_sic}')
-        """)
+            WHERE gvkey = ANY(%(gvkeys)s)
+        """, params={'gvkeys': predefined_gvkeys})
         print(f"Found {len(company_info)} companies in database")
-        if len(company_info) < len(config.PREDEFINED_GVKEYS):
+        if len(company_info) < len(predefined_gvkeys):
             found_gvkeys = set(company_info['gvkey'].tolist())
-            missing_gvkeys = [gvkey for gvkey in config.PREDEFINED_GVKEYS if gvkey not in found_gvkeys]
+            missing_gvkeys = [gvkey for gvkey in predefined_gvkeys if gvkey not in found_gvkeys]
             print(f"WARNING: {len(missing_gvkeys)} GVKEYs not found in database: {missing_gvkeys}")
     else:
         print(f"Getting company info for SIC codes {config.SIC_FILTER}...")
-        sic_list_str = ','.join([f"'{sic}'" for sic in config.SIC_FILTER])
         company_info = conn.raw_sql(f"""
             SELECT {', '.join(select_cols)}
             FROM comp.company
-            WHERE sic IN ({sic_list_str})
-        """)
+            WHERE sic = ANY(%(sics)s)
+        """, params={'sics': [str(sic) for sic in config.SIC_FILTER]})
         print(f"Found {len(company_info)} companies with real estate and related SIC codes")
 
     if "cik" in company_info.columns:
-        def _normalize_cik(v):
-            if pd.isna(v):
-                return pd.NA
-            s = str(v).strip()
-            if (not s) or (s.lower() in {"nan", "none", "<na>"}):
-                return pd.NA
-            if "." in s:
-                s = s.split(".")[0]
-            digits = "".join(ch for ch in s if ch.isdigit())
-            if not digits:
-                return pd.NA
-            return digits.zfill(10)
-
-        company_info["cik"] = company_info["cik"].apply(_normalize_cik)
+        # Normalize CIK with vectorized string ops: strip, treat text nulls as missing,
+        # drop any decimal part, keep digits only, then zero-pad to 10 characters
+        cik = company_info["cik"].astype("string").str.strip()
+        cik = cik.mask(cik.str.lower().isin(["", "nan", "none", "<na>"]))
+        cik = cik.str.split(".", n=1).str[0].str.replace(r"\D", "", regex=True)
+        company_info["cik"] = cik.mask((cik.str.len() == 0).fillna(False)).str.zfill(10)
      
     return company_info
 
 
+def _merge_company_info(compustat_df, company_info):
+    """
+    Left-join company info (sic, cik) onto Compustat data by gvkey.
+    
+    comp.company has one row per gvkey, so each column is attached with a hash
+    lookup (``Series.map``) rather than a full ``pd.merge``; duplicated keys or
+    overlapping columns fall back to the merge to keep its row/suffix semantics.
+    """
+    info_cols = company_info.columns.drop('gvkey')
+    if not company_info['gvkey'].is_unique or compustat_df.columns.isin(info_cols).any():
+        return pd.merge(compustat_df, company_info, on='gvkey', how='left')
+    
+    lookup = company_info.set_index('gvkey')
+    for col in info_cols:
+        compustat_df[col] = compustat_df['gvkey'].map(lookup[col])
+    return compustat_df
+
+
+def _sort_by_gvkey_date(df):
+    """
+    Sort Compustat data by (gvkey, datadate) on integer codes.
+    
+    Each key is factorized with ``sort=True`` (only the unique values are compared),
+    then rows are ordered by a stable lexsort on the codes, so the row sort never
+    compares gvkey strings. Missing keys sort last as in ``sort_values``; gvkey keeps
+    its string dtype for downstream merges and the Stata export.
+    """
+    sort_codes = []
+    for col in ['datadate', 'gvkey']:  # lexsort's last key is the primary one
+        codes, uniques = pd.factorize(df[col], sort=True)
+        sort_codes.append(np.where(codes < 0, len(uniques), codes))
+    return df.take(np.lexsort(sort_codes))
+
+
 def _prepare_stata_export(df):
     """
     Helper function to prepare DataFrame for Stata export.
@@ -118,7 +254,9 @@ def _prepare_stata_export(df):
     DataFrame
         DataFrame prepared for Stata export
     """
-    df_for_stata = df.copy()
+    # Shallow copy: columns below are replaced, never written in place, so the
+    # caller's frame is untouched without duplicating its data up front
+    df_for_stata = df.copy(deep=False)
     
     # Check for duplicate columns first
     if df_for_stata.columns.duplicated().any():
@@ -131,55 +269,147 @@ def _prepare_stata_export(df):
         if col in df_for_stata.columns:
             series = df_for_stata[col]
             if isinstance(series, pd.Series):
-                df_for_stata[col] = series.astype(str).replace('nan', '').replace('<NA>', '').fillna('')
+                df_for_stata[col] = series.astype(str).replace({'nan': '', '<NA>': ''}).fillna('')
     
-    # Ensure all object columns are proper types for Stata
-    for col in df_for_stata.columns:
+    # Ensure all object columns are proper types for Stata; infer_dtype scans each
+    # column in C and stops at the first non-string value
+    for col in df_for_stata.select_dtypes(include='object').columns:
         series = df_for_stata[col]
-        if isinstance(series, pd.Series) and series.dtype == 'object':
-            try:
-                if series.apply(lambda x: isinstance(x, str) if pd.notna(x) else True).all():
-                    df_for_stata[col] = series.astype(str).replace('nan', '').replace('<NA>', '').fillna('')
-            except Exception:
-                pass
-    
+        if pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty'):
+            df_for_stata[col] = series.astype(str).replace({'nan': '', '<NA>': ''}).fillna('')
+
     return df_for_stata
 
 
-def _save_data_files(df, pkl_path, csv_path, dta_path, description):
+def _raw_cache_file(config, pkl_path, parquet_path):
+    """Return the raw-data cache path for the configured CACHE_FORMAT."""
+    return parquet_path if config.CACHE_FORMAT == 'parquet' else pkl_path
+
+
+def _read_raw_cache(cache_path):
+    """Load a cached raw pull written by _save_data_files (parquet or pickle)."""
+    if str(cache_path).endswith('.parquet'):
+        return pd.read_parquet(str(cache_path), engine='pyarrow')
+    return pd.read_pickle(str(cache_path))
+
+
+# Arrow's errors for frames it cannot convert (e.g. mixed-type object columns)
+_ARROW_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+
+def _arrow_table_for_cache(df):
     """
-    Helper function to save DataFrame to pickle, CSV, and Stata formats.
+    Arrow table for the parquet cache.
+    
+    Object columns mixing types Arrow can't convert are stored as strings
+    (missing values stay missing) instead of failing the whole cache write.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except _ARROW_CONVERSION_ERRORS:
+        mixed = [col for col in df.select_dtypes(include='object').columns
+                 if pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed')]
+        if not mixed:
+            raise
+        print(f"Warning: storing mixed-type columns {mixed} as strings in the parquet cache")
+        return pa.Table.from_pandas(df.astype({col: 'string' for col in mixed}), preserve_index=False)
+
+
+def _arrow_table_for_csv(df):
+    """
+    Arrow table for the CSV export, with dates written as pandas writes them.
+    
+    Timestamp columns holding only midnight values are cast to dates, so datadate
+    is written as YYYY-MM-DD rather than with a zero time of day.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type) and field.type.tz is None:
+            column = table.column(i)
+            if pc.all(pc.equal(pc.floor_temporal(column, unit='day'), column)).as_py() is not False:
+                table = table.set_column(i, field.name, column.cast(pa.date32()))
+    return table
+
+
+def _save_data_files(df, cache_path, csv_path, dta_path, description, config):
+    """
+    Helper function to save DataFrame to the raw cache and optional CSV/Stata exports.
+    
+    The cache is written as zstd Parquet (or pickle if ``config.CACHE_FORMAT`` is
+    'pickle'); CSV and Stata are only written when ``config.EXPORT_CSV`` /
+    ``config.EXPORT_STATA`` are set, since they are by far the slowest writers. The
+    enabled writers run concurrently, each converting the frame itself.
+    
+    The CSV is written by Arrow's CSV writer, whose formatting differs from
+    ``DataFrame.to_csv`` in that the header and string fields are quoted, booleans
+    are written as true/false and timestamps with a time of day carry microseconds;
+    the values parse back identically. Frames Arrow can't convert use ``to_csv``.
     
     Parameters:
     -----------
     df : DataFrame
         DataFrame to save
-    pkl_path : str
-        Path for pickle file
+    cache_path : str
+        Path for the cache file (.parquet or .pkl)
     csv_path : str
         Path for CSV file
     dta_path : str
         Path for Stata file
     description : str
         Description of data for logging
+    config : module
+        Configuration module
     """
-    print(f"Saving {description} to {pkl_path}")
-    df.to_pickle(pkl_path)
+    def write_cache():
+        print(f"Saving {description} to {cache_path}")
+        if str(cache_path).endswith('.parquet'):
+            pq.write_table(_arrow_table_for_cache(df), cache_path, compression='zstd')
+        else:
+            df.to_pickle(cache_path)
     
-    print(f"Saving {description} to {csv_path}")
-    df.to_csv(csv_path, index=False)
+    def write_csv():
+        print(f"Saving {description} to {csv_path}")
+        try:
+            # Arrow's CSV writer formats whole columns natively
+            pa_csv.write_csv(_arrow_table_for_csv(df), csv_path)
+        except _ARROW_CONVERSION_ERRORS:
+            # Mixed-type object columns Arrow can't convert; use the pandas writer
+            df.to_csv(csv_path, index=False)
     
-    print(f"Saving {description} to {dta_path}")
-    df_for_stata = _prepare_stata_export(df)
-    try:
-        df_for_stata.to_stata(dta_path, write_index=False, version=118)
-        print(f"Successfully saved Stata file: {dta_path}")
-    except Exception as e:
-        print(f"Warning: Could not save as Stata format: {e}")
-        print("Continuing without Stata export...")
+    def write_stata():
+        print(f"Saving {description} to {dta_path}")
+        df_for_stata = _prepare_stata_export(df)
+        try:
+            df_for_stata.to_stata(dta_path, write_index=False, version=118)
+            print(f"Successfully saved Stata file: {dta_path}")
+        except Exception as e:
+            print(f"Warning: Could not save as Stata format: {e}")
+            print("Continuing without Stata export...")
+    
+    writers = [write_cache]
+    if config.EXPORT_CSV:
+        writers.append(write_csv)
+    if config.EXPORT_STATA:
+        writers.append(write_stata)
+    
+    # The files are independent and the Arrow/pickle writers release the GIL, so the
+    # fast cache write overlaps the slower CSV/Stata exports
+    with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+        futures = [executor.submit(writer) for writer in writers]
+    
+    # Every writer has finished; report each failure so one bad export never hides
+    # the others, then raise the first
+    errors = []
+    for writer, future in zip(writers, futures):
+        error = future.exception()
+        if error is not None:
+            print(f"Warning: {writer.__name__} failed for {description}: {error}")
+            errors.append(error)
+    if errors:
+        raise errors[0]
 
 
-def pull_compustat_annual(config=None):
+def pull_compustat_annual(config=None, conn=None, company_info=None):
     """
     Pull Compustat annual data from WRDS with caching support.
     
@@ -187,6 +417,11 @@ def pull_compustat_annual(config=None):
     -----------
     config : module, optional
         Configuration module (defaults to config_wrds_data if None)
+    conn : wrds.Connection, optional
+        Open WRDS connection to reuse; if None, one is opened and closed here
+    company_info : DataFrame, optional
+        Company info (gvkey, sic) already fetched by the caller; if None, it is
+        queried on the connection
         
     Returns:
     --------
@@ -195,23 +430,27 @@ def pull_compustat_annual(config=None):
     """
     if config is None:
         config = cfg
+    use_predefined = config.USE_PREDEFINED_GVKEYS
     
     # Check if we should refresh data or use cached version
-    if config.REFRESH_DATA or not config.COMPUSTAT_ANNUAL_RAW_FILE.exists():
+    cache_file = _raw_cache_file(config, config.COMPUSTAT_ANNUAL_RAW_FILE, config.COMPUSTAT_ANNUAL_RAW_PARQUET)
+    if config.REFRESH_DATA or not cache_file.exists():
         print("Downloading fresh Compustat annual data from WRDS...")
         
-        # Connect to WRDS
-        conn = wrds.Connection(wrds_username=config.WRDS_USERNAME)
+        # Connect to WRDS unless the caller shares an open connection
+        own_conn = conn is None
+        if own_conn:
+            conn = wrds.Connection(wrds_username=config.WRDS_USERNAME)
         
-        # Get company info
-        company_info = _get_company_info(conn, config)
+        # Get company info unless the caller already fetched it
+        if company_info is None:
+            company_info = _get_company_info(conn, config)
         
         # Get list of gvkeys for filtering
         filtered_gvkeys = company_info['gvkey'].tolist()
-        gvkey_list = "','".join(filtered_gvkeys)
         
         # Construct SQL query for annual data (comp.funda)
-        filter_description = f"predefined list ({len(filtered_gvkeys)} companies)" if config.USE_PREDEFINED_GVKEYS else f"real estate SIC codes ({len(filtered_gvkeys)} companies)"
+        filter_description = f"predefined list ({len(filtered_gvkeys)} companies)" if use_predefined else f"real estate SIC codes ({len(filtered_gvkeys)} companies)"
         print(f"Getting annual Compustat data for {filter_description}...")
         
         # Get annual-compatible variables (exclude quarterly-only variables like 'prcc')
@@ -226,44 +465,46 @@ def pull_compustat_annual(config=None):
             AND datafmt = 'STD'   -- Standardized format
             AND popsrc = 'D'      -- Domestic companies
             AND consol = 'C'      -- Consolidated statements
-            AND gvkey IN ('{gvkey_list}')  -- Filter to selected companies only
+            AND gvkey = ANY(%(gvkeys)s)  -- Filter to selected companies only
         """
         
-        # Execute query
-        compustat_df = conn.raw_sql(query)
+        # Execute query; the gvkey list is bound as one array parameter
+        compustat_df = _raw_sql_chunked(conn, query, params={'gvkeys': filtered_gvkeys})
         print(f"Downloaded {len(compustat_df)} annual observations")
         
         # Merge company info (SIC codes) with Compustat data
         print("Merging SIC codes with Compustat annual data...")
-        compustat_df = pd.merge(compustat_df, company_info, on='gvkey', how='left')
+        compustat_df = _merge_company_info(compustat_df, company_info)
         
-        # Close the WRDS connection
-        conn.close()
+        # Close the WRDS connection if this pull opened it
+        if own_conn:
+            conn.close()
         
         # Save raw data files
         _save_data_files(
             compustat_df,
-            str(config.COMPUSTAT_ANNUAL_RAW_FILE),
+            str(cache_file),
             str(config.COMPUSTAT_ANNUAL_RAW_CSV),
             str(config.COMPUSTAT_ANNUAL_RAW_DTA),
-            f"Compustat annual data ({filter_description})"
+            f"Compustat annual data ({filter_description})",
+            config
         )
         
     else:
         print("Loading cached Compustat annual data...")
-        compustat_df = pd.read_pickle(str(config.COMPUSTAT_ANNUAL_RAW_FILE))
+        compustat_df = _read_raw_cache(cache_file)
     
     # Process the data
     compustat_df['datadate'] = pd.to_datetime(compustat_df['datadate'])
-    compustat_df.sort_values(['gvkey', 'datadate'], inplace=True)
+    compustat_df = _sort_by_gvkey_date(compustat_df)
     
-    filter_desc = f"predefined list" if config.USE_PREDEFINED_GVKEYS else f"real estate SIC codes"
+    filter_desc = f"predefined list" if use_predefined else f"real estate SIC codes"
     print(f"Compustat annual data shape ({filter_desc}): {compustat_df.shape}")
     
     return compustat_df
 
 
-def pull_compustat_quarterly(config=None):
+def pull_compustat_quarterly(config=None, conn=None, company_info=None):
     """
     Pull Compustat quarterly data from WRDS with caching support.
     
@@ -271,6 +512,11 @@ def pull_compustat_quarterly(config=None):
     -----------
     config : module, optional
         Configuration module (defaults to config_wrds_data if None)
+    conn : wrds.Connection, optional
+        Open WRDS connection to reuse; if None, one is opened and closed here
+    company_info : DataFrame, optional
+        Company info (gvkey, sic) already fetched by the caller; if None, it is
+        queried on the connection
         
     Returns:
     --------
@@ -279,27 +525,31 @@ def pull_compustat_quarterly(config=None):
     """
     if config is None:
         config = cfg
+    use_predefined = config.USE_PREDEFINED_GVKEYS
     
     # Check if we should refresh data or use cached version
-    if config.REFRESH_DATA or not config.COMPUSTAT_QUARTERLY_RAW_FILE.exists():
+    cache_file = _raw_cache_file(config, config.COMPUSTAT_QUARTERLY_RAW_FILE, config.COMPUSTAT_QUARTERLY_RAW_PARQUET)
+    if config.REFRESH_DATA or not cache_file.exists():
         print("Downloading fresh Compustat quarterly data from WRDS...")
         
-        # Connect to WRDS
-        conn = wrds.Connection(wrds_username=config.WRDS_USERNAME)
+        # Connect to WRDS unless the caller shares an open connection
+        own_conn = conn is None
+        if own_conn:
+            conn = wrds.Connection(wrds_username=config.WRDS_USERNAME)
         
-        # Get company info
-        company_info = _get_company_info(conn, config)
+        # Get company info unless the caller already fetched it
+        if company_info is None:
+            company_info = _get_company_info(conn, config)
         
         # Get list of gvkeys for filtering
         filtered_gvkeys = company_info['gvkey'].tolist()
-        gvkey_list = "','".join(filtered_gvkeys)
         
         # Construct SQL query for quarterly data (comp.fundq)
         # Use add_quarterly_suffix() to add 'q' to variable names
         quarterly_vars = config.add_quarterly_suffix(config.compustat_vars)
         quarterly_vars = _filter_available_columns(quarterly_vars, conn, 'comp', 'fundq')
         
-        filter_description = f"predefined list ({len(filtered_gvkeys)} companies)" if config.USE_PREDEFINED_GVKEYS else f"real estate SIC codes ({len(filtered_gvkeys)} companies)"
+        filter_description = f"predefined list ({len(filtered_gvkeys)} companies)" if use_predefined else f"real estate SIC codes ({len(filtered_gvkeys)} companies)"
         print(f"Getting quarterly Compustat data for {filter_description}...")
         
         query = f"""
@@ -310,38 +560,40 @@ def pull_compustat_quarterly(config=None):
             AND datafmt = 'STD'   -- Standardized format
             AND popsrc = 'D'      -- Domestic companies
             AND consol = 'C'      -- Consolidated statements
-            AND gvkey IN ('{gvkey_list}')  -- Filter to selected companies only
+            AND gvkey = ANY(%(gvkeys)s)  -- Filter to selected companies only
         """
         
-        # Execute query
-        compustat_df = conn.raw_sql(query)
+        # Execute query; the gvkey list is bound as one array parameter
+        compustat_df = _raw_sql_chunked(conn, query, params={'gvkeys': filtered_gvkeys})
         print(f"Downloaded {len(compustat_df)} quarterly observations")
         
         # Merge company info (SIC codes) with Compustat data
         print("Merging SIC codes with Compustat quarterly data...")
-        compustat_df = pd.merge(compustat_df, company_info, on='gvkey', how='left')
+        compustat_df = _merge_company_info(compustat_df, company_info)
         
-        # Close the WRDS connection
-        conn.close()
+        # Close the WRDS connection if this pull opened it
+        if own_conn:
+            conn.close()
         
         # Save raw data files
         _save_data_files(
             compustat_df,
-            str(config.COMPUSTAT_QUARTERLY_RAW_FILE),
+            str(cache_file),
             str(config.COMPUSTAT_QUARTERLY_RAW_CSV),
             str(config.COMPUSTAT_QUARTERLY_RAW_DTA),
-            f"Compustat quarterly data ({filter_description})"
+            f"Compustat quarterly data ({filter_description})",
+            config
         )
         
     else:
         print("Loading cached Compustat quarterly data...")
-        compustat_df = pd.read_pickle(str(config.COMPUSTAT_QUARTERLY_RAW_FILE))
+        compustat_df = _read_raw_cache(cache_file)
     
     # Process the data
     compustat_df['datadate'] = pd.to_datetime(compustat_df['datadate'])
-    compustat_df.sort_values(['gvkey', 'datadate'], inplace=True)
+    compustat_df = _sort_by_gvkey_date(compustat_df)
     
-    filter_desc = f"predefined list" if config.USE_PREDEFINED_GVKEYS else f"real estate SIC codes"
+    filter_desc = f"predefined list" if use_predefined else f"real estate SIC codes"
     print(f"Compustat quarterly data shape ({filter_desc}): {compustat_df.shape}")
     
     return compustat_df
@@ -369,22 +621,38 @@ def pull_compustat_data(config=None):
     if config is None:
         config = cfg
     
-    # Pull annual data
+    # Pull annual and quarterly data concurrently: both are independent and
+    # network-bound, and psycopg2 releases the GIL while waiting on the socket
     print("\n" + "="*60)
-    print("PULLING COMPUSTAT ANNUAL DATA")
+    print("PULLING COMPUSTAT ANNUAL AND QUARTERLY DATA")
     print("="*60)
-    annual_df = pull_compustat_annual(config)
-    
-    # Pull quarterly data
-    print("\n" + "="*60)
-    print("PULLING COMPUSTAT QUARTERLY DATA")
-    print("="*60)
-    quarterly_df = pull_compustat_quarterly(config)
+    # Open a WRDS connection only if a pull needs fresh data, and fetch company info on
+    # it once. A connection runs one statement at a time, so when both pulls download,
+    # the quarterly pull opens its own connection to stream in parallel with the annual
+    annual_download = config.REFRESH_DATA or not _raw_cache_file(
+        config, config.COMPUSTAT_ANNUAL_RAW_FILE, config.COMPUSTAT_ANNUAL_RAW_PARQUET).exists()
+    quarterly_download = config.REFRESH_DATA or not _raw_cache_file(
+        config, config.COMPUSTAT_QUARTERLY_RAW_FILE, config.COMPUSTAT_QUARTERLY_RAW_PARQUET).exists()
+    needs_download = annual_download or quarterly_download
+    conn = wrds.Connection(wrds_username=config.WRDS_USERNAME) if needs_download else None
+    try:
+        company_info = _get_company_info(conn, config) if conn is not None else None
+        annual_conn = conn if annual_download else None
+        quarterly_conn = None if annual_download else conn
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            annual_future = executor.submit(pull_compustat_annual, config, annual_conn, company_info)
+            quarterly_future = executor.submit(pull_compustat_quarterly, config, quarterly_conn,
+                                               company_info)
+            annual_df, quarterly_df = annual_future.result(), quarterly_future.result()
+    finally:
+        if conn is not None:
+            conn.close()
     
     # Get company info
     # If we pulled fresh data, company_info was retrieved during pulls
     # Otherwise, load from cache
-    if config.REFRESH_DATA or not config.COMPANY_INFO_RAW_FILE.exists():
+    company_info_file = config.COMPANY_INFO_RAW_FILE
+    if config.REFRESH_DATA or not company_info_file.exists():
         # Company info was already retrieved during pulls, get it from annual_df
         base_cols = ['gvkey', 'sic']
         if 'cik' in annual_df.columns:
@@ -392,13 +660,13 @@ def pull_compustat_data(config=None):
         company_info = annual_df[base_cols].drop_duplicates().reset_index(drop=True)
         
         # Save company info
-        print(f"Saving company info to {config.COMPANY_INFO_RAW_FILE}")
-        company_info.to_pickle(str(config.COMPANY_INFO_RAW_FILE))
+        print(f"Saving company info to {company_info_file}")
+        company_info.to_pickle(str(company_info_file))
         print(f"Saving company info to {config.COMPANY_INFO_RAW_CSV}")
         company_info.to_csv(str(config.COMPANY_INFO_RAW_CSV), index=False)
     else:
         print("Loading cached company info...")
-        company_info = pd.read_pickle(str(config.COMPANY_INFO_RAW_FILE))
+        company_info = pd.read_pickle(str(company_info_file))
     
     return annual_df, quarterly_df, company_info
 
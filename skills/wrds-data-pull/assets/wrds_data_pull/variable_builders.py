@@ -27,6 +27,11 @@ class FinancialRatios:
 
     def __init__(self, df):
         self.df = df
+        # Column set and resolved variables are cached; construct a new instance
+        # if df's columns are replaced after construction
+        self._cols = set(df.columns)
+        self._var_cache = {}
+        self._derived = {}
 
     def tobins_q(self):
         """
@@ -40,15 +45,9 @@ class FinancialRatios:
         """
         # Get appropriate variables (quarterly or annual)
         at = self._get_var(['atq', 'at'])  # Total assets
-        csho = self._get_var(['cshoq', 'csho'])  # Shares outstanding
-        prcc = self._get_var(['prccq', 'prcc_f'])  # Stock price
-        dltt = self._get_var(['dlttq', 'dltt'])  # Long-term debt
-        dlc = self._get_var(['dlcq', 'dlc'])  # Current debt
         che = self._get_var(['cheq', 'che'])  # Cash
 
-        market_equity = abs(prcc) * csho  # abs() for negative prices (bid/ask avg)
-        total_debt = dltt.fillna(0) + dlc.fillna(0)
-        market_value_assets = market_equity + total_debt - che.fillna(0)
+        market_value_assets = self._market_equity() + self._total_debt() - che.fillna(0)
 
         return market_value_assets / at
 
@@ -65,18 +64,11 @@ class FinancialRatios:
         - Rajan & Zingales (1995, JF)
         - Frank & Goyal (2009, JFE)
         """
-        dltt = self._get_var(['dlttq', 'dltt'])
-        dlc = self._get_var(['dlcq', 'dlc'])
-        total_debt = dltt.fillna(0) + dlc.fillna(0)
-
         if method == 'book':
             at = self._get_var(['atq', 'at'])
-            return total_debt / at
+            return self._total_debt() / at
         elif method == 'market':
-            csho = self._get_var(['cshoq', 'csho'])
-            prcc = self._get_var(['prccq', 'prcc_f'])
-            market_equity = abs(prcc) * csho
-            return total_debt / market_equity
+            return self._total_debt() / self._market_equity()
         else:
             raise ValueError("method must be 'book' or 'market'")
 
@@ -112,10 +104,7 @@ class FinancialRatios:
         - Davis, Fama & French (2000, JF) - definition
         """
         seq = self._get_var(['seqq', 'seq'])
-        csho = self._get_var(['cshoq', 'csho'])
-        prcc = self._get_var(['prccq', 'prcc_f'])
-        market_equity = abs(prcc) * csho
-        return seq / market_equity
+        return seq / self._market_equity()
 
     def market_cap(self):
         """
@@ -123,16 +112,34 @@ class FinancialRatios:
 
         Returns market cap in millions (if csho in millions, prcc in dollars)
         """
-        csho = self._get_var(['cshoq', 'csho'])
-        prcc = self._get_var(['prccq', 'prcc_f'])
-        return abs(prcc) * csho
+        return self._market_equity()
+
+    def _market_equity(self):
+        """Price × shares, computed once and shared by the market-based ratios."""
+        if 'market_equity' not in self._derived:
+            csho = self._get_var(['cshoq', 'csho'])  # Shares outstanding
+            prcc = self._get_var(['prccq', 'prcc_f'])  # Stock price
+            # abs() for negative prices (bid/ask avg)
+            self._derived['market_equity'] = abs(prcc) * csho
+        return self._derived['market_equity']
+
+    def _total_debt(self):
+        """Long-term plus current debt (missing as zero), computed once."""
+        if 'total_debt' not in self._derived:
+            dltt = self._get_var(['dlttq', 'dltt'])  # Long-term debt
+            dlc = self._get_var(['dlcq', 'dlc'])  # Current debt
+            self._derived['total_debt'] = dltt.fillna(0) + dlc.fillna(0)
+        return self._derived['total_debt']
 
     def _get_var(self, var_names):
-        """Helper to get variable with quarterly or annual naming."""
-        for var in var_names:
-            if var in self.df.columns:
-                return self.df[var]
-        raise KeyError(f"None of {var_names} found in DataFrame")
+        """Helper to get variable with quarterly or annual naming (cached per name list)."""
+        key = tuple(var_names)
+        if key not in self._var_cache:
+            var = next((v for v in var_names if v in self._cols), None)
+            if var is None:
+                raise KeyError(f"None of {var_names} found in DataFrame")
+            self._var_cache[key] = self.df[var]
+        return self._var_cache[key]
 
 
 class REITMetrics:
@@ -147,6 +154,10 @@ class REITMetrics:
 
     def __init__(self, df):
         self.df = df
+        # Column set and resolved variables are cached; construct a new instance
+        # if df's columns are replaced after construction
+        self._cols = set(df.columns)
+        self._var_cache = {}
 
     def ffo(self, method='nareit'):
         """
@@ -195,11 +206,14 @@ class REITMetrics:
         return (price - nav_per_share) / nav_per_share
 
     def _get_var(self, var_names):
-        """Helper to get variable with quarterly or annual naming."""
-        for var in var_names:
-            if var in self.df.columns:
-                return self.df[var]
-        raise KeyError(f"None of {var_names} found in DataFrame")
+        """Helper to get variable with quarterly or annual naming (cached per name list)."""
+        key = tuple(var_names)
+        if key not in self._var_cache:
+            var = next((v for v in var_names if v in self._cols), None)
+            if var is None:
+                raise KeyError(f"None of {var_names} found in DataFrame")
+            self._var_cache[key] = self.df[var]
+        return self._var_cache[key]
 
 
 def construct_financial_ratios(df, ratios=None):
@@ -224,7 +238,9 @@ def construct_financial_ratios(df, ratios=None):
     >>> df = construct_financial_ratios(df, ratios=['leverage', 'roa'])
     """
     fin = FinancialRatios(df)
-    df = df.copy()
+    # Shallow copy: ratio columns are added to the new frame only, the input's
+    # data buffers are shared rather than duplicated
+    df = df.copy(deep=False)
 
     if ratios is None:
         ratios = ['tobins_q', 'leverage', 'roa', 'roe', 'btm', 'market_cap']
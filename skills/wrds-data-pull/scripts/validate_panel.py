@@ -12,20 +12,179 @@ Usage:
 
 import argparse
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Arrow CSV reader shared with the sibling coverage script
+from coverage_report import read_csv_arrow
+
+
+def _missing_count(column):
+    """Missing values in an Arrow array: nulls plus NaN for float columns."""
+    n_missing = column.null_count
+    if pa.types.is_floating(column.type):
+        n_missing += pc.sum(pc.is_nan(column)).as_py() or 0
+    return n_missing
+
+
+def _footer_null_counts(pf, columns):
+    """
+    Null counts from the parquet footer's row-group statistics, without reading data.
+
+    Only flat columns with a null count recorded in every row group are returned.
+    The statistic does not count NaN values, so callers pass non-float columns only.
+    """
+    metadata = pf.metadata
+    counts = dict.fromkeys(columns, 0)
+    complete = set(columns)
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        with_stats = set()
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            stats = chunk.statistics
+            if chunk.path_in_schema in counts and stats is not None and stats.has_null_count:
+                counts[chunk.path_in_schema] += stats.null_count
+                with_stats.add(chunk.path_in_schema)
+        complete &= with_stats
+    return {col: counts[col] for col in columns if col in complete}
+
+
+def _arrow_dtype_unless_temporal(arrow_type):
+    """types_mapper for to_pandas: ArrowDtype except for date/time types."""
+    if pa.types.is_temporal(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def load_parquet_panel(input_file, unit_id, time_id, load_keys=True):
+    """
+    Read only the columns the diagnostics use from a parquet file.
+
+    The panel keys (unless ``load_keys`` is False, when DuckDB computes the key
+    diagnostics) and known-issue columns are loaded with Arrow-backed dtypes;
+    date/time columns keep the pandas types pd.read_parquet would give them.
+    Missing counts for every other non-float column come from the footer
+    statistics, so their data is never decoded. Float columns (whose NaNs the
+    statistics omit) and columns without statistics are streamed through Arrow in
+    batches instead, never materialized in pandas.
+
+    Returns
+    -------
+    tuple : (df, null_counts)
+        Projected DataFrame and missing counts for every column in the file
+    """
+    pf = pq.ParquetFile(input_file)
+    schema = pf.schema_arrow
+    # Stored index columns are listed by name; a RangeIndex appears as a metadata
+    # dict and has no column in the file
+    index_cols = {c for c in (schema.pandas_metadata or {}).get('index_columns', [])
+                  if isinstance(c, str)}
+    all_cols = [c for c in schema.names if c not in index_cols]
+
+    wanted = set(KNOWN_ISSUE_COLUMNS)
+    if load_keys:
+        wanted.update((unit_id, time_id))
+    load_cols = [c for c in all_cols if c in wanted]
+    other_cols = [c for c in all_cols if c not in wanted]
+
+    table = pf.read(columns=load_cols)
+    # Counted on the Arrow side: isna() on an Arrow-backed float column misses NaN
+    null_counts = {col: _missing_count(table[col]) for col in load_cols}
+    # Temporal columns keep pd.read_parquet's types (datetime64, dates as objects) so
+    # key values print as Timestamp in the report; the rest are Arrow-backed
+    df = table.to_pandas(types_mapper=_arrow_dtype_unless_temporal)
+
+    footer_cols = [c for c in other_cols if not pa.types.is_floating(schema.field(c).type)]
+    null_counts.update(_footer_null_counts(pf, footer_cols))
+    scan_cols = [c for c in other_cols if c not in null_counts]
+    null_counts.update(dict.fromkeys(scan_cols, 0))
+    if scan_cols:
+        for batch in pf.iter_batches(columns=scan_cols):
+            for name, column in zip(batch.schema.names, batch.columns):
+                null_counts[name] += _missing_count(column)
+
+    return df, pd.Series(null_counts).reindex(all_cols)
+
+
+def factorize_keys(df, unit_id, time_id):
+    """
+    Factorize the panel keys once into sorted categoricals.
+
+    Every later groupby/duplicated call then works on the dense integer codes
+    instead of re-hashing the raw gvkey/permno and date values.
+    """
+    for col in (unit_id, time_id):
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            codes, uniques = pd.factorize(df[col], sort=True)
+            df[col] = pd.Categorical.from_codes(codes, categories=pd.Index(uniques))
+    return df
+
+
+def _key_codes(series):
+    """Integer codes of a key column (-1 for missing), ordered like the values."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(dtype=np.int64)
+    return pd.factorize(series, sort=True)[0].astype(np.int64, copy=False)
+
+
+def _pairs_sorted(u_codes, t_codes):
+    """True if the (unit, period) code pairs are already in lexicographic order.
+
+    Panels usually arrive sorted by (unit, period); one linear pass detects this
+    so the callers can skip the sort or hash step.
+    """
+    same_unit = u_codes[1:] == u_codes[:-1]
+    return bool(np.all((u_codes[1:] > u_codes[:-1])
+                       | (same_unit & (t_codes[1:] >= t_codes[:-1]))))
+
+
+def _periods_per_unit(df, unit_id, time_id):
+    """
+    Distinct non-missing periods for every unit with a non-missing id.
+
+    Sorts the (unit, period) code pairs once; each unit's count is then a
+    ``np.add.reduceat`` over the flags marking a new pair within the unit.
+    """
+    u_codes = _key_codes(df[unit_id])
+    t_codes = _key_codes(df[time_id])
+    keep = u_codes >= 0
+    u_codes, t_codes = u_codes[keep], t_codes[keep]
+    if len(u_codes) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if not _pairs_sorted(u_codes, t_codes):
+        order = np.lexsort((t_codes, u_codes))
+        u_codes, t_codes = u_codes[order], t_codes[order]
+
+    new_unit = np.empty(len(u_codes), dtype=bool)
+    new_unit[0] = True
+    np.not_equal(u_codes[1:], u_codes[:-1], out=new_unit[1:])
+    new_period = new_unit.copy()
+    new_period[1:] |= t_codes[1:] != t_codes[:-1]
+    new_period &= t_codes >= 0
+
+    return np.add.reduceat(new_period.astype(np.int64), np.flatnonzero(new_unit))
 
 
 def detect_panel_balance(df, unit_id, time_id):
     """Classify panel as balanced or unbalanced."""
-    panel_structure = df.groupby(unit_id)[time_id].agg(['count', 'nunique'])
-    max_periods = panel_structure['nunique'].max()
-    min_periods = panel_structure['nunique'].min()
+    periods_per_unit = _periods_per_unit(df, unit_id, time_id)
+    n_units = len(periods_per_unit)
+    max_periods = periods_per_unit.max() if n_units else np.nan
+    min_periods = periods_per_unit.min() if n_units else np.nan
 
-    n_units = df[unit_id].nunique()
-    n_periods = df[time_id].nunique()
-    total_obs = len(df)
+    return _classify_balance(n_units, df[time_id].nunique(), len(df),
+                             min_periods, max_periods)
+
+
+def _classify_balance(n_units, n_periods, total_obs, min_periods, max_periods):
+    """Balance summary dict from unit, period and observation counts."""
     balanced_obs = n_units * n_periods
 
     balance_ratio = total_obs / balanced_obs if balanced_obs > 0 else 0
@@ -51,8 +210,22 @@ def detect_panel_balance(df, unit_id, time_id):
 
 def detect_duplicates(df, unit_id, time_id):
     """Identify duplicate observations on primary keys."""
-    duplicates = df.groupby([unit_id, time_id]).size()
-    dup_keys = duplicates[duplicates > 1]
+    # Find rows with a repeated key first; only the (usually tiny) duplicated subset
+    # is then aggregated. Rows with a missing key are dropped by the groupby, as before
+    u_codes = _key_codes(df[unit_id])
+    t_codes = _key_codes(df[time_id])
+    if _pairs_sorted(u_codes, t_codes):
+        # Sorted keys: repeats are adjacent, so compare neighbours instead of hashing
+        repeat = (u_codes[1:] == u_codes[:-1]) & (t_codes[1:] == t_codes[:-1])
+        mask = np.zeros(len(df), dtype=bool)
+        mask[1:] |= repeat
+        mask[:-1] |= repeat
+    else:
+        mask = df.duplicated(subset=[unit_id, time_id], keep=False).to_numpy()
+    # observed=True: only key pairs present in the data, never the categorical
+    # cross product. Sorting is kept (on this small subset) so the sample lists
+    # duplicate keys in key order
+    dup_keys = df.loc[mask].groupby([unit_id, time_id], observed=True).size()
 
     if len(dup_keys) == 0:
         return {'has_duplicates': False, 'n_duplicate_keys': 0, 'sample': None}
@@ -65,14 +238,26 @@ def detect_duplicates(df, unit_id, time_id):
     }
 
 
-def coverage_report(df, unit_id, time_id):
-    """Calculate missing data coverage statistics."""
+def coverage_report(df, unit_id, time_id, null_counts=None, top=10, period_counts=None):
+    """Calculate missing data coverage statistics.
+
+    ``vars_with_high_missing`` holds the ``top`` variables with the highest share
+    (>25%) of missing values, most-missing first. ``null_counts`` (missing values
+    per column) may be passed when ``df`` holds only a projection of the data, as
+    returned by ``load_parquet_panel``; likewise ``period_counts`` (observations
+    per period) when the time key is not loaded.
+    """
     # Overall missingness
-    missing_pct = (df.isnull().sum() / len(df) * 100).sort_values(ascending=False)
-    high_missing = missing_pct[missing_pct > 25]
+    if null_counts is None:
+        null_counts = df.isnull().sum()
+    missing_pct = null_counts / len(df) * 100
+    # Partial sort: only the reported top variables are ordered
+    high_missing = missing_pct[missing_pct > 25].nlargest(top)
 
     # Time-series coverage (obs per period)
-    period_counts = df.groupby(time_id).size()
+    if period_counts is None:
+        # Only min/max/mean are used, so the group order does not matter
+        period_counts = df.groupby(time_id, observed=True, sort=False).size()
 
     return {
         'vars_with_high_missing': high_missing.to_dict() if len(high_missing) > 0 else {},
@@ -82,140 +267,327 @@ def coverage_report(df, unit_id, time_id):
     }
 
 
+def _float_values(series):
+    """Column as a float64 NumPy array with missing values as NaN (one conversion)."""
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _null_count(series):
+    """Missing values in a column; Arrow-backed columns are counted on the Arrow side.
+
+    For an Arrow string column (e.g. cusip from the parquet or CSV readers) this
+    reads the validity bitmap instead of testing every Python object for None/NaN.
+    """
+    if isinstance(series.dtype, pd.ArrowDtype):
+        return _missing_count(series.array.__arrow_array__())
+    return int(series.isnull().sum())
+
+
+def _count_negative(series):
+    """Values below zero; NaN compares False, so missing values never count."""
+    return np.count_nonzero(_float_values(series) < 0)
+
+
+def _count_zero_or_missing(series):
+    """Zero or missing values: not (|x| > 0) is True exactly for zero and NaN."""
+    return np.count_nonzero(~(np.abs(_float_values(series)) > 0))
+
+
+# Known-issue checks: issue name -> candidate columns (quarterly name first), the
+# counting function and, for data errors reported only when found, a note.
+# A new check is one more entry here
+_ISSUE_SPECS = {
+    'negative_book_equity': {'columns': ('seqq', 'seq'), 'count': _count_negative},
+    'zero_or_missing_shares': {'columns': ('cshoq', 'csho'), 'count': _count_zero_or_missing},
+    'missing_cusip': {'columns': ('cusip',), 'count': _null_count},
+    'negative_assets': {'columns': ('atq', 'at'), 'count': _count_negative,
+                        'note': 'DATA ERROR - investigate these observations'},
+}
+
+
 def check_known_issues(df):
-    """Flag common data quality issues."""
+    """Flag common data quality issues (one entry per ``_ISSUE_SPECS`` check)."""
     issues = {}
-
-    # Negative book equity
-    if 'seq' in df.columns or 'seqq' in df.columns:
-        seq_col = 'seqq' if 'seqq' in df.columns else 'seq'
-        neg_equity = (df[seq_col] < 0).sum()
-        issues['negative_book_equity'] = {
-            'count': neg_equity,
-            'pct': neg_equity / len(df) * 100
-        }
-
-    # Zero shares outstanding
-    if 'csho' in df.columns or 'cshoq' in df.columns:
-        csho_col = 'cshoq' if 'cshoq' in df.columns else 'csho'
-        zero_shares = (df[csho_col] == 0).sum() + df[csho_col].isnull().sum()
-        issues['zero_or_missing_shares'] = {
-            'count': zero_shares,
-            'pct': zero_shares / len(df) * 100
-        }
-
-    # Missing CUSIPs
-    if 'cusip' in df.columns:
-        missing_cusip = df['cusip'].isnull().sum()
-        issues['missing_cusip'] = {
-            'count': missing_cusip,
-            'pct': missing_cusip / len(df) * 100
-        }
-
-    # Negative assets (data error)
-    if 'at' in df.columns or 'atq' in df.columns:
-        at_col = 'atq' if 'atq' in df.columns else 'at'
-        neg_assets = (df[at_col] < 0).sum()
-        if neg_assets > 0:
-            issues['negative_assets'] = {
-                'count': neg_assets,
-                'pct': neg_assets / len(df) * 100,
-                'note': 'DATA ERROR - investigate these observations'
+    columns = set(df.columns)
+
+    for issue_name, spec in _ISSUE_SPECS.items():
+        col = next((c for c in spec['columns'] if c in columns), None)
+        if col is None:
+            continue
+
+        count = spec['count'](df[col])
+        # Undefined on an empty panel (reported as nan%, not a ZeroDivisionError)
+        pct = count / len(df) * 100 if len(df) else np.nan
+        if 'note' in spec:
+            if count > 0:
+                issues[issue_name] = {
+                    'count': count,
+                    'pct': pct,
+                    'note': spec['note']
+                }
+        else:
+            issues[issue_name] = {
+                'count': count,
+                'pct': pct
             }
 
     return issues
 
 
-def validate_panel(input_file, unit_id, time_id, output_file=None):
-    """Run full panel validation suite."""
+# Columns check_known_issues inspects, besides the panel keys
+KNOWN_ISSUE_COLUMNS = [c for spec in _ISSUE_SPECS.values() for c in spec['columns']]
+
+
+def read_stata(input_file):
+    """Read a Stata file with pyreadstat (C-backed) when installed, else pandas."""
+    try:
+        import pyreadstat
+    except ImportError:
+        return pd.read_stata(input_file)
+    # Match pd.read_stata: value labels as categoricals, dates as datetime64
+    df, _ = pyreadstat.read_dta(input_file, apply_value_formats=True,
+                                formats_as_category=True, dates_as_pandas_datetime=True)
+    return df
+
+
+# Default (engine='pandas') reader per file suffix; parquet uses load_parquet_panel
+_READERS = {
+    '.csv': read_csv_arrow,
+    '.dta': read_stata,
+}
+
+
+def read_with_engine(input_file, suffix, engine='pandas'):
+    """
+    Read a CSV or Stata file with the chosen dataframe engine.
+
+    'modin' (CSV and Stata) and 'dask' (CSV) parse on all cores and are optional
+    dependencies; the result is always a pandas DataFrame, since the diagnostics
+    themselves run on the key and issue columns only.
+    """
+    if engine == 'modin':
+        try:
+            import modin.pandas as mpd
+            from modin.utils import to_pandas
+        except ImportError:
+            raise ImportError("--engine modin requires modin (pip install 'modin[ray]')") from None
+        reader = mpd.read_csv if suffix == '.csv' else mpd.read_stata
+        return to_pandas(reader(input_file))
+
+    if engine == 'dask' and suffix == '.csv':
+        try:
+            import dask.dataframe as dd
+        except ImportError:
+            raise ImportError("--engine dask requires dask (pip install 'dask[dataframe]')") from None
+        return dd.read_csv(input_file).compute()
+
+    # pandas, or dask on a Stata file (dask has no Stata reader)
+    return _READERS[suffix](input_file)
+
+
+def _quote_ident(name):
+    """Quote a column name for use in a DuckDB query."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def duckdb_key_diagnostics(input_file, unit_id, time_id):
+    """
+    Balance, duplicate and per-period counts computed by DuckDB on a parquet file.
+
+    DuckDB scans only the two key columns, multithreaded and out of core, so the
+    keys are never loaded into pandas. The results match ``detect_panel_balance``,
+    ``detect_duplicates`` and the period counts used by ``coverage_report``.
+
+    Returns
+    -------
+    dict : {'balance': ..., 'duplicates': ..., 'period_counts': pandas.Series}
+    """
+    try:
+        import duckdb
+    except ImportError:
+        raise ImportError("--engine duckdb requires duckdb (pip install duckdb)") from None
+
+    u, t = _quote_ident(unit_id), _quote_ident(time_id)
+    con = duckdb.connect()
+    try:
+        con.read_parquet(str(input_file)).create_view('panel')
+
+        n_units, min_periods, max_periods = con.execute(
+            f"SELECT count(*), min(n), max(n) FROM ("
+            f"SELECT count(DISTINCT {t}) AS n FROM panel WHERE {u} IS NOT NULL GROUP BY {u})"
+        ).fetchone()
+        n_periods, total_obs = con.execute(
+            f"SELECT count(DISTINCT {t}), count(*) FROM panel"
+        ).fetchone()
+        balance = _classify_balance(
+            n_units, n_periods, total_obs,
+            np.nan if min_periods is None else min_periods,
+            np.nan if max_periods is None else max_periods,
+        )
+
+        # Keys with a missing part are not reported, as in detect_duplicates
+        dup_keys = (f"SELECT {u} AS u, {t} AS t, count(*) AS n FROM panel "
+                    f"WHERE {u} IS NOT NULL AND {t} IS NOT NULL "
+                    f"GROUP BY {u}, {t} HAVING count(*) > 1")
+        n_dup_keys, extra_obs = con.execute(
+            f"SELECT count(*), sum(n) - count(*) FROM ({dup_keys})"
+        ).fetchone()
+        if n_dup_keys == 0:
+            duplicates = {'has_duplicates': False, 'n_duplicate_keys': 0, 'sample': None}
+        else:
+            # Through pandas, so key values have the same types (e.g. Timestamp) as
+            # in the pandas engine's report
+            sample = con.execute(f"{dup_keys} ORDER BY u, t LIMIT 10").fetchdf().itertuples(index=False)
+            duplicates = {
+                'has_duplicates': True,
+                'n_duplicate_keys': n_dup_keys,
+                'total_duplicate_obs': extra_obs,
+                'sample': {(key_u, key_t): n for key_u, key_t, n in sample},
+            }
+
+        period_counts = con.execute(
+            f"SELECT count(*) AS n FROM panel WHERE {t} IS NOT NULL GROUP BY {t}"
+        ).fetchdf()['n']
+    finally:
+        con.close()
+
+    return {'balance': balance, 'duplicates': duplicates, 'period_counts': period_counts}
+
+
+@contextmanager
+def _report_writer(output_file=None):
+    """
+    Yield ``emit(line)``, printing each report line and writing it to ``output_file``.
+
+    The file is written under a temporary name and renamed into place only when
+    the report completes, so a failed run never leaves a truncated report behind.
+    """
+    if not output_file:
+        yield print
+        return
+
+    report_path = Path(output_file)
+    partial_path = report_path.with_name(report_path.name + '.partial')
+    try:
+        with open(partial_path, 'w') as report_file:
+            def emit(line):
+                print(line)
+                print(line, file=report_file)
+            yield emit
+        partial_path.replace(report_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+
+def validate_panel(input_file, unit_id, time_id, output_file=None, engine='pandas'):
+    """Run full panel validation suite.
+
+    ``engine`` ('pandas', 'modin' or 'dask') selects the CSV/Stata reader; parquet
+    inputs always use the projected Arrow reader, which is already multithreaded.
+    ``engine='duckdb'`` (parquet only) instead computes the key-based diagnostics
+    in DuckDB, for panels whose keys are too large to group in pandas.
+    """
     # Load data
     print(f"Loading data from: {input_file}")
     suffix = Path(input_file).suffix.lower()
 
-    if suffix == '.parquet':
-        df = pd.read_parquet(input_file)
-    elif suffix == '.csv':
-        df = pd.read_csv(input_file)
-    elif suffix == '.dta':
-        df = pd.read_stata(input_file)
+    null_counts = None
+    if engine == 'duckdb':
+        if suffix != '.parquet':
+            raise ValueError("--engine duckdb supports parquet input only")
+        df, null_counts = load_parquet_panel(input_file, unit_id, time_id, load_keys=False)
+    elif suffix == '.parquet':
+        df, null_counts = load_parquet_panel(input_file, unit_id, time_id)
+    elif suffix in _READERS:
+        df = read_with_engine(input_file, suffix, engine)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
-    print(f"Loaded {len(df):,} observations, {len(df.columns)} variables\n")
+    all_columns = df.columns if null_counts is None else null_counts.index
+    print(f"Loaded {len(df):,} observations, {len(all_columns)} variables\n")
 
     # Validate column existence
-    if unit_id not in df.columns:
+    if unit_id not in all_columns:
         raise ValueError(f"Unit ID '{unit_id}' not found in data")
-    if time_id not in df.columns:
+    if time_id not in all_columns:
         raise ValueError(f"Time ID '{time_id}' not found in data")
 
-    # Run diagnostics
-    results = []
-
-    # 1. Panel balance
-    results.append("=" * 70)
-    results.append("PANEL STRUCTURE")
-    results.append("=" * 70)
-    balance = detect_panel_balance(df, unit_id, time_id)
-    results.append(f"Panel type: {balance['type'].upper()}")
-    results.append(f"Units: {balance['n_units']:,}")
-    results.append(f"Periods: {balance['n_periods']:,}")
-    results.append(f"Observations: {balance['total_obs']:,} / {balance['expected_obs']:,} expected")
-    results.append(f"Balance ratio: {balance['balance_ratio']:.1%}")
-    results.append(f"Periods per unit: {balance['min_periods_per_unit']} to {balance['max_periods_per_unit']}")
-
-    # 2. Duplicates
-    results.append("\n" + "=" * 70)
-    results.append("DUPLICATE DETECTION")
-    results.append("=" * 70)
-    dups = detect_duplicates(df, unit_id, time_id)
-    if dups['has_duplicates']:
-        results.append(f"⚠ DUPLICATES FOUND: {dups['n_duplicate_keys']} unique keys")
-        results.append(f"Total extra observations: {dups['total_duplicate_obs']}")
-        results.append("\nSample duplicate keys (showing up to 10):")
-        for key, count in dups['sample'].items():
-            results.append(f"  {key}: {count} occurrences")
+    if engine == 'duckdb':
+        key_stats = duckdb_key_diagnostics(input_file, unit_id, time_id)
     else:
-        results.append("✓ No duplicates detected")
-
-    # 3. Coverage
-    results.append("\n" + "=" * 70)
-    results.append("DATA COVERAGE")
-    results.append("=" * 70)
-    coverage = coverage_report(df, unit_id, time_id)
-    results.append(f"Observations per period: {coverage['period_obs_min']:,} to {coverage['period_obs_max']:,}")
-    results.append(f"Average: {coverage['period_obs_mean']:.0f}")
-
-    if coverage['vars_with_high_missing']:
-        results.append("\nVariables with >25% missing data:")
-        for var, pct in sorted(coverage['vars_with_high_missing'].items(),
-                             key=lambda x: x[1], reverse=True)[:10]:
-            results.append(f"  {var}: {pct:.1f}% missing")
-    else:
-        results.append("\n✓ No variables with >25% missing data")
-
-    # 4. Known issues
-    results.append("\n" + "=" * 70)
-    results.append("KNOWN DATA ISSUES")
-    results.append("=" * 70)
-    issues = check_known_issues(df)
-    if issues:
-        for issue_name, issue_data in issues.items():
-            results.append(f"\n{issue_name.replace('_', ' ').title()}:")
-            results.append(f"  Count: {issue_data['count']:,} ({issue_data['pct']:.1f}%)")
-            if 'note' in issue_data:
-                results.append(f"  {issue_data['note']}")
-    else:
-        results.append("✓ No known issues detected")
-
-    results.append("\n" + "=" * 70)
-
-    # Output results
-    output_text = "\n".join(results)
-    print(output_text)
+        # Factorize the keys once; balance, duplicate and coverage checks reuse the codes
+        key_stats = None
+        df = factorize_keys(df, unit_id, time_id)
+
+    # Run diagnostics. Report lines are written to stdout (and the report file)
+    # as they are produced rather than collected into one string
+    with _report_writer(output_file) as emit:
+        # 1. Panel balance
+        emit("=" * 70)
+        emit("PANEL STRUCTURE")
+        emit("=" * 70)
+        if key_stats:
+            balance = key_stats['balance']
+        else:
+            balance = detect_panel_balance(df, unit_id, time_id)
+        emit(f"Panel type: {balance['type'].upper()}")
+        emit(f"Units: {balance['n_units']:,}")
+        emit(f"Periods: {balance['n_periods']:,}")
+        emit(f"Observations: {balance['total_obs']:,} / {balance['expected_obs']:,} expected")
+        emit(f"Balance ratio: {balance['balance_ratio']:.1%}")
+        emit(f"Periods per unit: {balance['min_periods_per_unit']} to {balance['max_periods_per_unit']}")
+
+        # 2. Duplicates
+        emit("\n" + "=" * 70)
+        emit("DUPLICATE DETECTION")
+        emit("=" * 70)
+        if key_stats:
+            dups = key_stats['duplicates']
+        else:
+            dups = detect_duplicates(df, unit_id, time_id)
+        if dups['has_duplicates']:
+            emit(f"⚠ DUPLICATES FOUND: {dups['n_duplicate_keys']} unique keys")
+            emit(f"Total extra observations: {dups['total_duplicate_obs']}")
+            emit("\nSample duplicate keys (showing up to 10):")
+            for key, count in dups['sample'].items():
+                emit(f"  {key}: {count} occurrences")
+        else:
+            emit("✓ No duplicates detected")
+
+        # 3. Coverage
+        emit("\n" + "=" * 70)
+        emit("DATA COVERAGE")
+        emit("=" * 70)
+        coverage = coverage_report(df, unit_id, time_id, null_counts,
+                                   period_counts=key_stats and key_stats['period_counts'])
+        emit(f"Observations per period: {coverage['period_obs_min']:,} to {coverage['period_obs_max']:,}")
+        emit(f"Average: {coverage['period_obs_mean']:.0f}")
+
+        if coverage['vars_with_high_missing']:
+            emit("\nVariables with >25% missing data:")
+            for var, pct in coverage['vars_with_high_missing'].items():
+                emit(f"  {var}: {pct:.1f}% missing")
+        else:
+            emit("\n✓ No variables with >25% missing data")
+
+        # 4. Known issues
+        emit("\n" + "=" * 70)
+        emit("KNOWN DATA ISSUES")
+        emit("=" * 70)
+        issues = check_known_issues(df)
+        if issues:
+            for issue_name, issue_data in issues.items():
+                emit(f"\n{issue_name.replace('_', ' ').title()}:")
+                emit(f"  Count: {issue_data['count']:,} ({issue_data['pct']:.1f}%)")
+                if 'note' in issue_data:
+                    emit(f"  {issue_data['note']}")
+        else:
+            emit("✓ No known issues detected")
+
+        emit("\n" + "=" * 70)
 
     if output_file:
-        Path(output_file).write_text(output_text)
         print(f"\nReport saved to: {output_file}")
 
 
@@ -231,11 +603,16 @@ def main():
     parser.add_argument('--time_id', required=True,
                        help='Time identifier column (e.g., datacqtr, date)')
     parser.add_argument('--output', help='Output file for report (optional)')
+    parser.add_argument('--engine', choices=['pandas', 'modin', 'dask', 'duckdb'],
+                       default='pandas',
+                       help='Reader for csv/dta input; modin and dask use all cores '
+                            'and must be installed separately. duckdb (parquet only) '
+                            'computes the key diagnostics out of core (default: pandas)')
 
     args = parser.parse_args()
 
     try:
-        validate_panel(args.input, args.unit_id, args.time_id, args.output)
+        validate_panel(args.input, args.unit_id, args.time_id, args.output, args.engine)
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
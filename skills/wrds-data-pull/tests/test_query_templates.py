@@ -0,0 +1,134 @@
+"""Tests for query_templates._raw_sql_chunked with a fake psycopg2 connection."""
+
+import datetime
+import importlib.util
+import sys
+import types
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+# wrds connects through SQLAlchemy; the fake driver connection is served by a real pool
+sa_pool = pytest.importorskip('sqlalchemy.pool')
+
+MODULE_PATH = (Path(__file__).resolve().parents[1]
+               / 'assets' / 'wrds_data_pull' / 'query_templates.py')
+
+
+@pytest.fixture(scope='module')
+def qt():
+    """Import query_templates with the wrds package and config module stubbed out."""
+    stubs = {'wrds': types.ModuleType('wrds'),
+             '1---config_wrds_data': types.ModuleType('1---config_wrds_data')}
+    saved = {name: sys.modules.get(name) for name in stubs}
+    sys.modules.update(stubs)
+    try:
+        spec = importlib.util.spec_from_file_location('query_templates', MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        for name, mod in saved.items():
+            if mod is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = mod
+
+
+class ProgrammingError(Exception):
+    pass
+
+
+class FakeCursor:
+    def __init__(self, conn, rows, columns, fail):
+        self.conn = conn
+        self.rows = list(rows)
+        self.columns = columns
+        self.fail = fail
+        self.description = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if self.fail:
+            raise RuntimeError('query failed')
+        self.conn.executed.append((query, params))
+        self.description = [(name,) for name in self.columns]
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class FakePsycopgConnection:
+    """Mimics psycopg2: named cursors are refused in autocommit mode."""
+
+    def __init__(self, rows=(), columns=(), fail=False):
+        self.autocommit = True  # as set up by wrds.Connection
+        self.rows, self.columns, self.fail = rows, columns, fail
+        self.executed = []
+        self.rollbacks = 0
+        self.closed = False
+
+    def cursor(self, name=None):
+        if name is not None and self.autocommit:
+            raise ProgrammingError("can't use a named cursor outside of transactions")
+        return FakeCursor(self, self.rows, self.columns, self.fail)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def _wrds_conn(raw):
+    """
+    wrds.Connection stand-in. As with SQLAlchemy, conn.connection.connection is the
+    pool's proxy (_ConnectionFairy) around the driver connection, not the driver itself.
+    """
+    proxy = sa_pool.StaticPool(lambda: raw, reset_on_return=None).connect()
+    assert proxy is not raw
+    return types.SimpleNamespace(connection=types.SimpleNamespace(connection=proxy))
+
+
+def test_streams_in_transaction_and_restores_autocommit(qt):
+    rows = [('001004', Decimal('1.5'), datetime.date(2020, 3, 31)),
+            ('001045', None, datetime.date(2020, 6, 30)),
+            ('001050', Decimal('22.125'), None)]
+    raw = FakePsycopgConnection(rows, ['gvkey', 'atq', 'datadate'])
+
+    df = qt._raw_sql_chunked(_wrds_conn(raw), 'SELECT 1', params={'g': ['001004']}, chunksize=2)
+
+    assert list(df.columns) == ['gvkey', 'atq', 'datadate']
+    assert df['gvkey'].tolist() == ['001004', '001045', '001050']
+    assert df['atq'].dtype == 'float64'
+    assert df['atq'].iloc[2] == 22.125
+    assert raw.executed == [('SELECT 1', {'g': ['001004']})]
+    assert raw.autocommit is True
+    assert raw.rollbacks == 1
+
+
+def test_empty_result_keeps_columns(qt):
+    raw = FakePsycopgConnection([], ['gvkey', 'atq'])
+
+    df = qt._raw_sql_chunked(_wrds_conn(raw), 'SELECT 1')
+
+    assert df.empty
+    assert list(df.columns) == ['gvkey', 'atq']
+    assert raw.autocommit is True
+
+
+def test_failed_query_restores_autocommit(qt):
+    raw = FakePsycopgConnection(fail=True)
+
+    with pytest.raises(RuntimeError):
+        qt._raw_sql_chunked(_wrds_conn(raw), 'SELECT 1')
+
+    assert raw.autocommit is True
+    assert raw.rollbacks == 1